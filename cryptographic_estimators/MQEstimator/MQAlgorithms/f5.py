@@ -19,9 +19,21 @@
 from cryptographic_estimators.MQEstimator.mq_algorithm import MQAlgorithm
 from cryptographic_estimators.MQEstimator.mq_problem import MQProblem
 from cryptographic_estimators.MQEstimator import degree_of_regularity
+from functools import lru_cache
 from math import log2, comb as binomial
 
 
+@lru_cache(maxsize=None)
+def _cached_dreg(n: int, m: int, q: int):
+    return degree_of_regularity.quadratic_system(n, m, q)
+
+
+@lru_cache(maxsize=None)
+def _cached_ncols(n: int, dreg: int):
+    ncols = max(binomial(n + dreg - 1, dreg), 1)
+    return ncols, log2(ncols)
+
+
 class F5(MQAlgorithm):
     def __init__(self, problem: MQProblem, **kwargs):
         """Construct an instance of the F5 complexity estimator.
@@ -59,6 +71,12 @@ class F5(MQAlgorithm):
         self._memory_complexity = None
         self._dreg = None
         self._ncols_at_degree_dreg = None
+        self._log2_ncols_at_degree_dreg = None
+
+        self._nmq = self.get_reduced_parameters()
+        n, m, q = self._nmq
+        self._log2_n, self._log2_m, self._log2_q = log2(n), log2(m), log2(q)
+        self._h_log2_q = self._h * self._log2_q
 
     def degree_of_polynomials(self):
         """Return a list of degree of the polynomials.
@@ -74,17 +92,21 @@ class F5(MQAlgorithm):
 
     def _get_degree_of_regularity(self):
         if self._dreg is None:
-            n, m, q = self.get_reduced_parameters()
-            self._dreg = degree_of_regularity.quadratic_system(n, m, q)
+            self._dreg = _cached_dreg(*self._nmq)
         return self._dreg
 
     def _get_number_of_columns_at_degree_of_regularity(self):
         if self._ncols_at_degree_dreg is None:
-            n, _, _ = self.get_reduced_parameters()
+            n, _, _ = self._nmq
             dreg = self._get_degree_of_regularity()
-            self._ncols_at_degree_dreg = max(binomial(n + dreg - 1, dreg), 1)
+            self._ncols_at_degree_dreg, self._log2_ncols_at_degree_dreg = _cached_ncols(n, dreg)
         return self._ncols_at_degree_dreg
 
+    def _get_log2_number_of_columns_at_degree_of_regularity(self):
+        if self._log2_ncols_at_degree_dreg is None:
+            self._get_number_of_columns_at_degree_of_regularity()
+        return self._log2_ncols_at_degree_dreg
+
     def _compute_time_complexity(self, parameters: dict):
         """Return the time complexity of the algorithm for a given set of parameters.
 
@@ -101,14 +123,13 @@ class F5(MQAlgorithm):
             >>> E = F5(MQProblem(n=1, m=15, q=2), bit_complexities=False)
             >>> E.time_complexity()
             3.9068905956085187
+            >>> F5(MQProblem(n=10, m=15, q=3, nsolutions=20), bit_complexities=False).time_complexity()
+            63.32192809488736
         """
-        _, m, q = self.get_reduced_parameters()
         w = self.linear_algebra_constant()
-        ncols = self._get_number_of_columns_at_degree_of_regularity()
-        time = w * log2(ncols)
-        time += log2(m)
-        h = self._h
-        return h * log2(q) + max(time, self._time_complexity_fglm())
+        time = w * self._get_log2_number_of_columns_at_degree_of_regularity()
+        time += self._log2_m
+        return self._h_log2_q + max(time, self._time_complexity_fglm())
 
     def _time_complexity_fglm(self):
         """Return the time complexity of the FGLM algorithm for this system.
@@ -118,12 +139,9 @@ class F5(MQAlgorithm):
             >>> from cryptographic_estimators.MQEstimator.mq_problem import MQProblem
             >>> E = F5(MQProblem(n=10, m=15, q=3, nsolutions=1))
             >>> E._time_complexity_fglm()
-            6.321928094887363
+            6.321928094887362
         """
-        n, _, q = self.get_reduced_parameters()
-        D = 2**self.problem.nsolutions
-        h = self._h
-        return h * log2(q) + log2(n * D**3)
+        return self._h_log2_q + self._log2_n + 3 * self.problem.nsolutions
 
     def _compute_memory_complexity(self, parameters: dict):
         """Return the memory complexity of the algorithm for a given set of parameters.
@@ -135,28 +153,20 @@ class F5(MQAlgorithm):
             >>> F5_.memory_complexity()
             24.578308707446713
         """
-        n, m, _ = self.get_reduced_parameters()
-        ncols = self._get_number_of_columns_at_degree_of_regularity()
-        memory = max(log2(ncols) * 2, log2(m * n**2))
+        log2_ncols = self._get_log2_number_of_columns_at_degree_of_regularity()
+        memory = max(log2_ncols * 2, self._log2_m + 2 * self._log2_n)
         return memory
 
     def _compute_tilde_o_time_complexity(self, parameters: dict):
         """Return the Ō time complexity of the algorithm for a given set of parameters."""
-        q = self.problem.order_of_the_field()
         w = self.linear_algebra_constant()
-        ncols = self._get_number_of_columns_at_degree_of_regularity()
-        time = w * log2(ncols)
-        h = self._h
-        return h * log2(q) + max(time, self._tilde_o_time_complexity_fglm(parameters))
+        time = w * self._get_log2_number_of_columns_at_degree_of_regularity()
+        return self._h_log2_q + max(time, self._tilde_o_time_complexity_fglm(parameters))
 
     def _tilde_o_time_complexity_fglm(self, parameters: dict):
         """Return the Ō time complexity of the FGLM algorithm for this system."""
-        q = self.problem.order_of_the_field()
-        D = 2**self.problem.nsolutions
-        h = self._h
-        return h * log2(q) + log2(D**3)
+        return self._h_log2_q + 3 * self.problem.nsolutions
 
     def _compute_tilde_o_memory_complexity(self, parameters: dict):
         """Return the Ō memory complexity of the algorithm for a given set of parameters."""
-        ncols = self._get_number_of_columns_at_degree_of_regularity()
-        return log2(ncols) * 2
+        return self._get_log2_number_of_columns_at_degree_of_regularity() * 2
@@ -18,7 +18,7 @@
 
 from ..base_problem import BaseProblem
 from .pe_constants import *
-from math import log2, factorial
+from math import log, log2, lgamma
 
 
 class PEProblem(BaseProblem):
@@ -39,6 +39,8 @@ class PEProblem(BaseProblem):
         self.parameters[PE_CODE_DIMENSION] = k
         self.parameters[PE_FIELD_SIZE] = q
         self.parameters[PE_HULL_DIMENSION] = kwargs.get("h", min(n, n - k))
+        self._params_tuple = (n, k, q, self.parameters[PE_HULL_DIMENSION])
+        self._bitcost_offset = log2(log2(q))
         self.nsolutions = kwargs.get("nsolutions", max(self.expected_number_solutions(), 0))
 
     def to_bitcomplexity_time(self, basic_operations: float):
@@ -47,8 +49,7 @@ class PEProblem(BaseProblem):
         Args:
             basic_operations (float): Number of field additions (logarithmic)
         """
-        _, _, q, _ = self.get_parameters()
-        return basic_operations + log2(log2(q))
+        return basic_operations + self._bitcost_offset
 
     def to_bitcomplexity_memory(self, elements_to_store: float):
         """Returns the memory bit-complexity associated to a given number of Fq elements to store.
@@ -56,17 +57,22 @@ class PEProblem(BaseProblem):
         Args:
             elements_to_store (float): Number of elements to store (logarithmic)
         """
-        _, _, q, _ = self.get_parameters()
-        return elements_to_store + log2(log2(q))
+        return elements_to_store + self._bitcost_offset
 
     def expected_number_solutions(self):
         """Returns the logarithm of the expected number of existing solutions to the problem."""
         n, k, q, _ = self.get_parameters()
-        return log2(q) * k * k + log2(factorial(n)) - log2(q) * n * k
+        return log2(q) * k * (k - n) + lgamma(n + 1) / log(2)
 
     def get_parameters(self):
-        """Returns n, k, q and h."""
-        return self.parameters.values()
+        """Returns n, k, q and h.
+
+        Tests:
+            >>> from cryptographic_estimators.PEEstimator.pe_problem import PEProblem
+            >>> PEProblem(n=100, k=50, q=31).get_parameters()
+            (100, 50, 31, 50)
+        """
+        return self._params_tuple
 
     def __repr__(self):
         n, k, q, _ = self.get_parameters()
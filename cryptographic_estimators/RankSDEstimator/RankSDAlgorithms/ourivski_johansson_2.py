@@ -16,11 +16,22 @@
 # ****************************************************************************
 
 
-from math import log2, ceil
+from math import inf
+import numpy as np
 from ..ranksd_algorithm import RankSDAlgorithm
+from ..ranksd_helper import valid_parameters_mask
 from ..ranksd_problem import RankSDProblem
 
 
+def _time_complexity(w, q, m, k, r):
+    return w * (np.log2(k + r) + np.log2(r)) + (r - 1) * (m - r) * np.log2(q)
+
+
+def _matrix_dimensions(m, k, r):
+    nn = -(-((k + 1) * r) // (m - r))
+    return nn * m, (k + 1 + nn) * r
+
+
 class OJ2(RankSDAlgorithm):
     """Construct an instance of OJ strategy 2 estimator
 
@@ -62,7 +73,7 @@ class OJ2(RankSDAlgorithm):
 
         q, m, _, k, r = self.problem.get_parameters()
         self.problem.set_operations_on_base_field(self.on_base_field)
-        time_complexity = self._w * (log2(k + r) + log2(r)) + (r - 1) * (m - r) * log2(q)
+        time_complexity = float(_time_complexity(self._w, q, m, k, r))
 
         return time_complexity
 
@@ -80,7 +91,55 @@ class OJ2(RankSDAlgorithm):
               17.081441827692018
         """
         _, m, _, k, r = self.problem.get_parameters()
-        nn = ceil(((k + 1) * r) / (m - r))
-        n_rows = nn * m
-        n_columns = (k + 1 + nn) * r
+        n_rows, n_columns = _matrix_dimensions(m, k, r)
         return self.__compute_memory_complexity_helper__(n_rows, n_columns, self.on_base_field)
+
+    @staticmethod
+    def basic_operations_batch(w, q, m, k, r):
+        """Return the logarithm of the number of basic operations for arrays of parameters.
+
+           The result is not converted to bit complexity, i.e., it corresponds to ``time_complexity()`` only for
+           ``bit_complexities=False``. Entries violating the RankSDProblem constraints evaluate to inf.
+
+           Args:
+               w (float): Linear algebra constant.
+               q (np.ndarray): Base field orders.
+               m (np.ndarray): Extension degrees.
+               k (np.ndarray): Code dimensions.
+               r (np.ndarray): Target ranks.
+
+           Tests:
+               >>> from cryptographic_estimators.RankSDEstimator.RankSDAlgorithms.ourivski_johansson_2 import OJ2
+               >>> OJ2.basic_operations_batch(3, [2, 2], [127, 10], [48, 5], [7, 10]).tolist()
+               [745.7661439067468, inf]
+        """
+
+        q, m, k, r = (np.asarray(x) for x in (q, m, k, r))
+        valid = valid_parameters_mask(q, m, k, r)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(valid, _time_complexity(w, q, m, k, r), inf)
+
+    @staticmethod
+    def elements_to_store_batch(q, m, k, r):
+        """Return the logarithm of the number of field elements to store for arrays of parameters.
+
+           The result is not converted to bit complexity, i.e., it corresponds to ``memory_complexity()`` only for
+           ``bit_complexities=False``. Entries violating the RankSDProblem constraints evaluate to inf.
+
+           Args:
+               q (np.ndarray): Base field orders.
+               m (np.ndarray): Extension degrees.
+               k (np.ndarray): Code dimensions.
+               r (np.ndarray): Target ranks.
+
+           Tests:
+               >>> from cryptographic_estimators.RankSDEstimator.RankSDAlgorithms.ourivski_johansson_2 import OJ2
+               >>> OJ2.elements_to_store_batch([2, 2], [127, 10], [48, 5], [7, 10]).tolist()
+               [17.081441827692018, inf]
+        """
+
+        q, m, k, r = (np.asarray(x) for x in (q, m, k, r))
+        valid = valid_parameters_mask(q, m, k, r)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            n_rows, n_columns = _matrix_dimensions(m, k, r)
+            return np.where(valid, np.log2(np.where(valid, n_rows * n_columns, 1)), inf)
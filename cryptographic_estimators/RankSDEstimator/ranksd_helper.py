@@ -1,4 +1,6 @@
 from math import comb as binomial, inf
+import numpy as np
+from cryptographic_estimators.helper import is_prime_power
 from .ranksd_constants import RANKSD_NUMBER_OF_COLUMNS_X_TO_GUESS, \
     RANKSD_LINEAR_VARIABLES_DEGREE, RANKSD_NUMBER_OF_PUNCTURED_POSITIONS
 
@@ -201,3 +203,24 @@ def find_valid_choices_param_sm_fqm(m, n, k, r, a_min, a_max, p_min, p_max, b_mi
                               RANKSD_NUMBER_OF_PUNCTURED_POSITIONS: p})
 
     return valid_choices
+
+
+def valid_parameters_mask(q, m, k, r):
+    """Returns a boolean array marking which entries satisfy the RankSDProblem constraints on q, m, k and r.
+
+       The code length n is not part of the batch inputs, so the constraint k < n is not checked.
+
+       Args:
+           q (np.ndarray): Base field orders.
+           m (np.ndarray): Extension degrees.
+           k (np.ndarray): Code dimensions.
+           r (np.ndarray): Target ranks.
+
+       Tests:
+           >>> from cryptographic_estimators.RankSDEstimator.ranksd_helper import valid_parameters_mask
+           >>> valid_parameters_mask([2, 6, 2, 2], [127, 127, 10, 1], [48, 48, 5, 5], [7, 7, 10, 1])
+           array([ True, False, False, False])
+    """
+    q, m, k, r = (np.asarray(x) for x in (q, m, k, r))
+    prime_power = np.vectorize(lambda x: is_prime_power(int(x)), otypes=[bool])(q)
+    return prime_power & (m >= 1) & (k >= 1) & (r >= 1) & (r < m)
@@ -17,6 +17,8 @@
 
 from enum import Enum
 from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from math import log2
 
 
@@ -298,3 +300,30 @@ def ngates(q, n, theta=2):
         return n + log2(2 * log2(q) ** 2 + log2(q))
     else:
         return n + log2(log2(q)) * theta
+
+
+def _time_complexity_of(cls, kwargs: dict, problem):
+    return cls(problem, **kwargs).time_complexity()
+
+
+def batch_time_complexities(cls, problems, n_jobs=None, **kwargs):
+    """Returns the time complexities of an algorithm for many problem instances, evaluated in parallel.
+
+    Every instance is independent, so the list is split across worker processes. Module-level caches are per process.
+
+    Args:
+        cls (type): The algorithm class, e.g. F5.
+        problems (list): The problem instances to estimate.
+        n_jobs (int): The number of worker processes (default: None, i.e., one per CPU).
+        **kwargs: Additional keyword arguments passed to ``cls``.
+
+    Examples:
+        >>> from cryptographic_estimators.helper import batch_time_complexities
+        >>> from cryptographic_estimators.MQEstimator.MQAlgorithms.f5 import F5
+        >>> from cryptographic_estimators.MQEstimator.mq_problem import MQProblem
+        >>> problems = [MQProblem(n=10, m=15, q=3), MQProblem(n=1, m=15, q=2)]
+        >>> batch_time_complexities(F5, problems, n_jobs=2, bit_complexities=False)
+        [30.550746998589286, 3.9068905956085187]
+    """
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        return list(executor.map(partial(_time_complexity_of, cls, kwargs), problems))